@@ -5,66 +5,222 @@ Includes fixes for saving/loading, undefined attributes, and UI/logic clarity.
 Usage: python gobi_escape_full_fixed.py
 """
 
+import bisect
+import copy
+import functools
+import hashlib
+import queue
 import random
-import json
 import os
-import time
+import sys
+import threading
+
+# Prefer orjson for (de)serializing the save file — its native encoder is
+# several times faster than the stdlib — but fall back to json so the game
+# works without the optional dependency.
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _loads(data):
+        return orjson.loads(data)
+
+except ImportError:
+    # json is imported on first use so runs that never save or load
+    # don't pay for it at startup
+    def _dumps(obj):
+        import json
+
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+    def _loads(data):
+        import json
+
+        return json.loads(data)
 
 SAVE_FILE = "gobi_escape_save.json"
+
+# Version tag at the head of the positional save record. The nested-dict
+# saves written by older builds count as version 1 and are still loadable.
+SCHEMA_VERSION = 2
+
+# Upper bounds of the event roll ranges (oasis, cache, sandstorm, bandits,
+# sickness) per difficulty. Difficulty is fixed for a whole game, so these
+# are computed once instead of rescaling by the chance modifier every roll.
+DIFFICULTY_THRESHOLDS = {
+    "EASY": (2, 6, 14, 21, 25),
+    "NORMAL": (3, 8, 18, 27, 32),
+    "HARD": (3, 9, 21, 32, 38),
+}
 TOTAL_DISTANCE = 200  # km to win
 MAP_WIDTH = 40  # characters in ASCII progress bar
 
+# Single PRNG instance for the whole game. Hot paths hoist the bound
+# random() method to a local and scale its output instead of going
+# through random.randint's argument checking on every draw.
+_rng = random.Random()
+
+# 256-entry jitter tables for the officers' pursuit speed. Indexing with
+# a random byte replaces the float arithmetic of a uniform draw per move;
+# 1/256 granularity is plenty for these narrow spreads.
+_JITTER_STEADY = tuple(0.8 + (i / 255) * 0.4 for i in range(256))  # 0.8 .. 1.2
+_JITTER_DASH = tuple(0.4 + (i / 255) * 0.6 for i in range(256))  # 0.4 .. 1.0
+
+# Action menu never changes, so build it once and emit it with a single
+# write instead of nine print() calls per turn.
+_MENU = (
+    "\nActions:\n"
+    " A) Drink water\n"
+    " B) Move - Moderate\n"
+    " C) Move - Full speed\n"
+    " D) Rest (Camel recovers, officers close in)\n"
+    " E) Use bandage (restore player health)\n"
+    " F) Status and Inventory\n"
+    " S) Save game\n"
+    " Q) Quit (forfeit)\n"
+)
+
+# Achievements as a bitmask: awarding is a single OR, counting is a
+# popcount, and the name table drives display and legacy-save import.
+ACH_ESCAPE = 1 << 0
+ACH_HOARDER = 1 << 1
+ACH_OASIS_SEEKER = 1 << 2
+ACH_TOUGH_RIDE = 1 << 3
+ACH_PRISTINE = 1 << 4
+ACH_HYDRATED = 1 << 5
+ACH_FOUND_OASIS = 1 << 6
+
+ACHIEVEMENT_NAMES = {
+    ACH_ESCAPE: "Escape!",
+    ACH_HOARDER: "Hoarder",
+    ACH_OASIS_SEEKER: "Oasis Seeker",
+    ACH_TOUGH_RIDE: "Tough Ride",
+    ACH_PRISTINE: "Pristine",
+    ACH_HYDRATED: "Hydrated",
+    ACH_FOUND_OASIS: "Found Oasis",
+}
+
+def _achievement_names(mask: int):
+    return [name for bit, name in ACHIEVEMENT_NAMES.items() if mask & bit]
+
 # ---------- Game Entities ----------
 
 class Player:
+    __slots__ = ("thirst", "health", "distance", "water", "bandage", "score", "achievements", "oasis_found")
+
     def __init__(self):
         self.thirst = 0            # 0-5 (5 = dead)
         self.health = 100          # 0-100 (player health)
         self.distance = 0          # km traveled
-        self.inventory = {"water": 5, "bandage": 1}
+        # fixed inventory keys are plain attributes — no dict probes per access
+        self.water = 5
+        self.bandage = 1
         self.score = 0
-        self.achievements = set()
+        self.achievements = 0
         self.oasis_found = 0
 
 class Camel:
+    __slots__ = ("stamina", "health", "sickness")
+
     def __init__(self):
         self.stamina = 0           # 0-100 (100 = collapsed/exhausted)
         self.health = 100          # could be used by sandstorms/bandits
         self.sickness = False      # explicitly defined to avoid attribute errors
 
 class Officers:
+    __slots__ = ("distance_behind",)
+
     def __init__(self, start_behind=20):
         # distance_behind: how many km behind the player (positive means behind)
         self.distance_behind = float(start_behind)
 
 # ---------- Utility Functions ----------
 
-def clamp(v, a, b):
-    return max(a, min(b, v))
+# Dramatic pause between turns: tunable via GOBI_PAUSE and skipped
+# entirely when stdout is piped (scripted runs, benchmarks, tests).
+_PAUSE = float(os.environ.get("GOBI_PAUSE", "0.35")) if sys.stdout.isatty() else 0.0
 
 def pause_short():
-    time.sleep(0.35)
+    if _PAUSE:
+        import time
+
+        time.sleep(_PAUSE)
+
+@functools.lru_cache(maxsize=64)
+def _banner(title):
+    ruler = "=" * len(title)
+    return f"\n{ruler}\n{title}\n{ruler}\n"
 
 def print_header(title):
-    print("\n" + "="*len(title))
-    print(title)
-    print("="*len(title))
+    # Titles repeat (menus, summaries, recent day numbers), so the built
+    # banner is cached and emitted with one write.
+    sys.stdout.write(_banner(title))
+
+# Digest of the last state we wrote, so repeated saves of an unchanged
+# game don't rewrite the file.
+_last_save_hash = None
 
-def save_game(state: dict):
+# os.replace makes every save atomic, so a crash mid-write can never
+# leave a torn file; the expensive fsync is only paid every Nth save.
+_FSYNC_EVERY = 8
+_save_count = 0
+
+def save_game(state):
+    global _last_save_hash, _save_count
     try:
-        with open(SAVE_FILE, "w", encoding="utf-8") as f:
-            json.dump(state, f, ensure_ascii=False, indent=2)
+        # Serialize into one buffer first, then issue a single write() —
+        # much cheaper than streaming many small writes into the file.
+        data = _dumps(state)
+        h = hashlib.blake2b(data, digest_size=8).digest()
+        if h == _last_save_hash:
+            print("[No changes to save]")
+            return
+        tmp = SAVE_FILE + ".tmp"
+        with open(tmp, "wb", buffering=1 << 16) as f:
+            f.write(data)
+            _save_count += 1
+            if _save_count % _FSYNC_EVERY == 0:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, SAVE_FILE)
+        _last_save_hash = h
         print(f"[Saved to {SAVE_FILE}]")
     except Exception as e:
         print("[Save failed]", e)
 
+# Saves run on a background thread so the interactive loop never waits
+# on file I/O. States are deep-copied before queueing because the main
+# loop keeps mutating player/camel while the worker writes.
+_save_queue = None
+
+def _save_worker():
+    while True:
+        state = _save_queue.get()
+        try:
+            save_game(state)
+        finally:
+            _save_queue.task_done()
+
+def request_save(state: dict):
+    global _save_queue
+    if _save_queue is None:
+        _save_queue = queue.Queue(maxsize=4)
+        threading.Thread(target=_save_worker, daemon=True).start()
+    _save_queue.put(copy.deepcopy(state))
+
+def drain_saves():
+    if _save_queue is not None:
+        _save_queue.join()
+
 def load_game():
     if not os.path.exists(SAVE_FILE):
         print("[No save file found]")
         return None
     try:
-        with open(SAVE_FILE, "r", encoding="utf-8") as f:
-            state = json.load(f)
+        with open(SAVE_FILE, "rb", buffering=1 << 16) as f:
+            state = _loads(f.read())
         print(f"[Loaded from {SAVE_FILE}]")
         return state
     except Exception as e:
@@ -88,87 +244,177 @@ def choose_difficulty():
             return "HARD", 0.16, 2.0
         print("Choose 1, 2 or 3.")
 
+# Empty progress bar, copied and patched per call — a C-level slice copy
+# plus two index stores instead of building a 40-element list and joining.
+_MAP_TEMPLATE = bytearray(b"-" * MAP_WIDTH)
+
 def ascii_map(player: Player, officers: Officers):
     # map shows player position and officers position on a 0..TOTAL_DISTANCE scale
-    p_frac = clamp(player.distance / TOTAL_DISTANCE, 0.0, 1.0)
+    p_frac = max(0.0, min(1.0, player.distance / TOTAL_DISTANCE))
     o_position = player.distance - officers.distance_behind  # officers absolute position
-    o_frac = clamp(o_position / TOTAL_DISTANCE, 0.0, 1.0)
-    bar = ["-"] * MAP_WIDTH
+    o_frac = max(0.0, min(1.0, o_position / TOTAL_DISTANCE))
+    bar = _MAP_TEMPLATE[:]
     p_idx = min(MAP_WIDTH-1, int(p_frac * (MAP_WIDTH-1)))
     o_idx = min(MAP_WIDTH-1, int(o_frac * (MAP_WIDTH-1)))
     if o_idx == p_idx:
-        bar[p_idx] = "X"  # very close or overlapping
+        bar[p_idx] = ord("X")  # very close or overlapping
     else:
-        bar[p_idx] = "P"  # player
-        bar[o_idx] = "O"  # officers
-    return "[" + "".join(bar) + f"] {player.distance}/{TOTAL_DISTANCE} km"
-
-def random_event(player: Player, camel: Camel, officers: Officers, difficulty: str):
-    roll = random.randint(1, 100)
-    chance_modifier = {"EASY": 0.8, "NORMAL": 1.0, "HARD": 1.2}[difficulty]
-    # Oasis rare
-    if roll <= int(3 * chance_modifier):
-        player.oasis_found += 1
-        player.thirst = 0
-        camel.stamina = 0
-        player.inventory["water"] = 5
-        player.achievements.add("Found Oasis")
-        return "✨ You found a hidden oasis! Water refilled & camel rested."
-    # Supply cache
-    if 4 <= roll <= int(8 * chance_modifier):
-        found_water = random.randint(1, 3)
-        player.inventory["water"] = player.inventory.get("water", 0) + found_water
-        if random.random() < 0.3:
-            player.inventory["bandage"] = player.inventory.get("bandage", 0) + 1
-        return f"🔎 You discovered a small supply cache: +{found_water} water."
-    # Sandstorm
-    if 9 <= roll <= int(18 * chance_modifier):
-        thirst_increase = random.randint(1, 2)
-        camel_loss = random.randint(5, 20)
-        player.thirst = clamp(player.thirst + thirst_increase, 0, 5)
-        camel.stamina = clamp(camel.stamina + camel_loss, 0, 100)
-        player.health = clamp(player.health - random.randint(0, 10), 0, 100)
-        return "🌪️ A sandstorm lashes you — thirst and camel fatigue increase, and you suffer some damage."
-    # Bandits
-    if 19 <= roll <= int(27 * chance_modifier):
-        lost = 0
-        if player.inventory.get("water", 0) > 0 and random.random() < 0.7:
-            lost = random.randint(1, min(3, player.inventory["water"]))
-            player.inventory["water"] -= lost
-        player.health = clamp(player.health - random.randint(5, 25), 0, 100)
-        camel.health = clamp(camel.health - random.randint(0, 15), 0, 100)
-        return f"🏴 Bandits attacked! You lose {lost} water and take damage."
-    # Camel sickness
-    if 28 <= roll <= int(32 * chance_modifier):
-        camel.sickness = True
-        camel.stamina = clamp(camel.stamina + random.randint(10, 25), 0, 100)
-        return "🤒 Your camel looks ill — it will recover slowly unless you rest."
+        bar[p_idx] = ord("P")  # player
+        bar[o_idx] = ord("O")  # officers
+    return f"[{bar.decode('ascii')}] {player.distance}/{TOTAL_DISTANCE} km"
+
+def _event_oasis(player: Player, camel: Camel, officers: Officers):
+    player.oasis_found += 1
+    player.thirst = 0
+    camel.stamina = 0
+    player.water = 5
+    player.achievements |= ACH_FOUND_OASIS
+    return "✨ You found a hidden oasis! Water refilled & camel rested."
+
+def _event_cache(player: Player, camel: Camel, officers: Officers):
+    _r = _rng.random
+    found_water = int(_r() * 3) + 1
+    player.water += found_water
+    if _r() < 0.3:
+        player.bandage += 1
+    return f"🔎 You discovered a small supply cache: +{found_water} water."
+
+def _event_sandstorm(player: Player, camel: Camel, officers: Officers):
+    _r = _rng.random
+    thirst_increase = int(_r() * 2) + 1
+    camel_loss = int(_r() * 16) + 5
+    player.thirst = min(5, player.thirst + thirst_increase)
+    camel.stamina = min(100, camel.stamina + camel_loss)
+    player.health = max(0, player.health - int(_r() * 11))
+    return "🌪️ A sandstorm lashes you — thirst and camel fatigue increase, and you suffer some damage."
+
+def _event_bandits(player: Player, camel: Camel, officers: Officers):
+    _r = _rng.random
+    lost = 0
+    if player.water > 0 and _r() < 0.7:
+        lost = int(_r() * min(3, player.water)) + 1
+        player.water -= lost
+    player.health = max(0, player.health - (int(_r() * 21) + 5))
+    camel.health = max(0, camel.health - int(_r() * 16))
+    return f"🏴 Bandits attacked! You lose {lost} water and take damage."
+
+def _event_sickness(player: Player, camel: Camel, officers: Officers):
+    camel.sickness = True
+    camel.stamina = min(100, camel.stamina + int(_rng.random() * 16) + 10)
+    return "🤒 Your camel looks ill — it will recover slowly unless you rest."
+
+def _event_nothing(player: Player, camel: Camel, officers: Officers):
     return None
 
-def calculate_score(player: Player, camel: Camel, difficulty_multiplier: float):
-    base = player.distance * 10
-    leftover = player.inventory.get("water", 0) * 20
-    health_bonus = player.health
-    camel_bonus = max(0, 100 - camel.stamina)
-    oasis_bonus = player.oasis_found * 150
-    achievement_bonus = len(player.achievements) * 100
+# Ordered to match the threshold tuples: oasis, cache, sandstorm,
+# bandits, sickness, then the quiet-turn fallthrough.
+_EVENT_HANDLERS = (
+    _event_oasis,
+    _event_cache,
+    _event_sandstorm,
+    _event_bandits,
+    _event_sickness,
+    _event_nothing,
+)
+
+def random_event(player: Player, camel: Camel, officers: Officers, thresholds: tuple):
+    # Bisect the roll into the threshold table instead of walking an
+    # if-ladder; one O(log n) search picks the handler directly.
+    roll = int(_rng.random() * 100) + 1
+    idx = bisect.bisect_left(thresholds, roll)
+    return _EVENT_HANDLERS[idx](player, camel, officers)
+
+@functools.lru_cache(maxsize=1024)
+def _score_from(distance, water, health, stamina, oasis_found, achievement_count, multiplier):
+    base = distance * 10
+    leftover = water * 20
+    health_bonus = health
+    camel_bonus = max(0, 100 - stamina)
+    oasis_bonus = oasis_found * 150
+    achievement_bonus = achievement_count * 100
     raw = base + leftover + health_bonus + camel_bonus + oasis_bonus + achievement_bonus
-    return int(raw * difficulty_multiplier)
+    return int(raw * multiplier)
+
+def calculate_score(player: Player, camel: Camel, difficulty_multiplier: float):
+    # The score is recomputed every turn even when nothing changed;
+    # memoizing on the inputs makes those calls a cache hit.
+    return _score_from(
+        player.distance,
+        player.water,
+        player.health,
+        camel.stamina,
+        player.oasis_found,
+        bin(player.achievements).count("1"),  # int.bit_count needs 3.10+
+        difficulty_multiplier,
+    )
 
 def check_achievements(player: Player, camel: Camel):
     if player.distance >= TOTAL_DISTANCE:
-        player.achievements.add("Escape!")
-    if player.inventory.get("water", 0) >= 10:
-        player.achievements.add("Hoarder")
+        player.achievements |= ACH_ESCAPE
+    if player.water >= 10:
+        player.achievements |= ACH_HOARDER
     if player.oasis_found >= 1:
-        player.achievements.add("Oasis Seeker")
+        player.achievements |= ACH_OASIS_SEEKER
     if camel.stamina < 20:
-        player.achievements.add("Tough Ride")
+        player.achievements |= ACH_TOUGH_RIDE
     if player.health >= 90 and camel.health >= 90:
-        player.achievements.add("Pristine")
+        player.achievements |= ACH_PRISTINE
 
 # ---------- Main Game Loop ----------
 
+def _restore_state(state):
+    """Rebuild entities from a loaded save, or return None if unusable."""
+    player = Player()
+    camel = Camel()
+    officers = Officers()
+    if isinstance(state, list):
+        # positional record; order must match the snapshot in game_loop
+        if len(state) != 16 or state[0] != SCHEMA_VERSION:
+            print("[Save file has an unsupported format]")
+            return None
+        (player.thirst, player.health, player.distance,
+         player.water, player.bandage, player.score,
+         player.oasis_found, player.achievements,
+         camel.stamina, camel.health, camel.sickness) = state[1:12]
+        officers.distance_behind = float(state[12])
+        difficulty = state[13]
+        officer_speed = float(state[14])
+        diff_multiplier = float(state[15])
+        return player, camel, officers, difficulty, officer_speed, diff_multiplier
+    # legacy (version 1) nested-dict saves
+    player_state = state.get("player", {})
+    player.thirst = player_state.get("thirst", 0)
+    player.health = player_state.get("health", 100)
+    player.distance = player_state.get("distance", 0)
+    inventory = player_state.get("inventory")
+    if inventory:  # oldest saves nested these in a dict
+        player.water = inventory.get("water", 5)
+        player.bandage = inventory.get("bandage", 1)
+    else:
+        player.water = player_state.get("water", 5)
+        player.bandage = player_state.get("bandage", 1)
+    player.score = player_state.get("score", 0)
+    player.oasis_found = player_state.get("oasis_found", 0)
+    # achievements; legacy saves stored a list of names
+    ach = player_state.get("achievements", 0)
+    if isinstance(ach, list):
+        name_bits = {name: bit for bit, name in ACHIEVEMENT_NAMES.items()}
+        player.achievements = 0
+        for name in ach:
+            player.achievements |= name_bits.get(name, 0)
+    else:
+        player.achievements = int(ach)
+    camel_state = state.get("camel", {})
+    camel.stamina = camel_state.get("stamina", 0)
+    camel.health = camel_state.get("health", 100)
+    camel.sickness = camel_state.get("sickness", False)
+    officers_state = state.get("officers", {})
+    officers.distance_behind = float(officers_state.get("distance_behind", officers.distance_behind))
+    difficulty = state.get("difficulty", "NORMAL")
+    officer_speed = float(state.get("officer_speed", 0.12))
+    diff_multiplier = float(state.get("diff_multiplier", 1.5))
+    return player, camel, officers, difficulty, officer_speed, diff_multiplier
+
 def play_game():
     print_header("Escape Across the Great Gobi — Ultimate Edition")
     # Allow load
@@ -177,33 +423,11 @@ def play_game():
         if input("> ").strip().lower() == "y":
             state = load_game()
             if state:
-                # restore
-                player = Player()
-                # restore primitives and convert achievements list -> set
-                player_state = state.get("player", {})
-                player.thirst = player_state.get("thirst", 0)
-                player.health = player_state.get("health", 100)
-                player.distance = player_state.get("distance", 0)
-                player.inventory = player_state.get("inventory", {"water": 5, "bandage": 1})
-                player.score = player_state.get("score", 0)
-                player.oasis_found = player_state.get("oasis_found", 0)
-                # achievements
-                ach_list = player_state.get("achievements", [])
-                player.achievements = set(ach_list if isinstance(ach_list, list) else [])
-                camel = Camel()
-                camel_state = state.get("camel", {})
-                camel.stamina = camel_state.get("stamina", 0)
-                camel.health = camel_state.get("health", 100)
-                camel.sickness = camel_state.get("sickness", False)
-                officers = Officers()
-                officers_state = state.get("officers", {})
-                officers.distance_behind = float(officers_state.get("distance_behind", officers.distance_behind))
-                difficulty = state.get("difficulty", "NORMAL")
-                officer_speed = float(state.get("officer_speed", 0.12))
-                diff_multiplier = float(state.get("diff_multiplier", 1.5))
-                print("Game loaded. Resuming...")
-                pause_short()
-                return game_loop(player, camel, officers, difficulty, officer_speed, diff_multiplier)
+                restored = _restore_state(state)
+                if restored:
+                    print("Game loaded. Resuming...")
+                    pause_short()
+                    return game_loop(*restored)
     # New game
     difficulty, officer_speed, diff_multiplier = choose_difficulty()
     player = Player()
@@ -214,22 +438,21 @@ def play_game():
     return game_loop(player, camel, officers, difficulty, officer_speed, diff_multiplier)
 
 def game_loop(player: Player, camel: Camel, officers: Officers, difficulty, officer_speed, diff_multiplier):
+    thresholds = DIFFICULTY_THRESHOLDS[difficulty]
+    _r = _rng.random
+    _randbyte = _rng.getrandbits
     day = 1
     while True:
         print_header(f"Day {day} — Choose your action")
-        print(ascii_map(player, officers))
-        print(f"Player Health: {player.health}/100 | Thirst: {player.thirst}/5 | Water: {player.inventory.get('water',0)}")
-        print(f"Camel Stamina (fatigue): {camel.stamina}% | Camel Health: {camel.health}/100")
-        print(f"Officers are {int(officers.distance_behind)} km behind you.")
-        print("\nActions:")
-        print(" A) Drink water")
-        print(" B) Move - Moderate")
-        print(" C) Move - Full speed")
-        print(" D) Rest (Camel recovers, officers close in)")
-        print(" E) Use bandage (restore player health)")
-        print(" F) Status and Inventory")
-        print(" S) Save game")
-        print(" Q) Quit (forfeit)")
+        # One buffered write for the whole status block instead of a
+        # print() (lock + flush) per line.
+        sys.stdout.write(
+            f"{ascii_map(player, officers)}\n"
+            f"Player Health: {player.health}/100 | Thirst: {player.thirst}/5 | Water: {player.water}\n"
+            f"Camel Stamina (fatigue): {camel.stamina}% | Camel Health: {camel.health}/100\n"
+            f"Officers are {int(officers.distance_behind)} km behind you.\n"
+            f"{_MENU}"
+        )
 
         choice = input("> ").strip().upper()
         event_msg = None
@@ -241,87 +464,81 @@ def game_loop(player: Player, camel: Camel, officers: Officers, difficulty, offi
             return
 
         elif choice == "S":
-            # save (serialize achievements to list)
-            state = {
-                "player": {
-                    "thirst": player.thirst,
-                    "health": player.health,
-                    "distance": player.distance,
-                    "inventory": player.inventory,
-                    "score": player.score,
-                    "oasis_found": player.oasis_found,
-                    "achievements": list(player.achievements),
-                },
-                "camel": {
-                    "stamina": camel.stamina,
-                    "health": camel.health,
-                    "sickness": camel.sickness,
-                },
-                "officers": {
-                    "distance_behind": officers.distance_behind,
-                },
-                "difficulty": difficulty,
-                "officer_speed": officer_speed,
-                "diff_multiplier": diff_multiplier,
-            }
-            save_game(state)
+            # positional snapshot — order must match _restore_state;
+            # skipping the repeated key strings keeps the payload small
+            state = [
+                SCHEMA_VERSION,
+                player.thirst,
+                player.health,
+                player.distance,
+                player.water,
+                player.bandage,
+                player.score,
+                player.oasis_found,
+                player.achievements,
+                camel.stamina,
+                camel.health,
+                camel.sickness,
+                officers.distance_behind,
+                difficulty,
+                officer_speed,
+                diff_multiplier,
+            ]
+            request_save(state)
             continue
 
         elif choice == "A":
-            if player.inventory.get("water", 0) > 0:
-                player.inventory["water"] -= 1
+            if player.water > 0:
+                player.water -= 1
                 player.thirst = 0
                 print("You drink a bottle of water. Thirst reset.")
-                player.achievements.add("Hydrated")
+                player.achievements |= ACH_HYDRATED
             else:
                 print("You have no water left!")
 
         elif choice == "B":
             # moderate move
-            travel = random.randint(5, 12)
+            travel = int(_r() * 8) + 5
             player.distance += travel
-            player.thirst = clamp(player.thirst + 1, 0, 5)
-            camel.stamina = clamp(camel.stamina + random.randint(5, 12), 0, 100)
+            player.thirst = min(5, player.thirst + 1)
+            camel.stamina = min(100, camel.stamina + int(_r() * 8) + 5)
             # officers advance based on officer_speed and randomness
-            officers.distance_behind = clamp(
-                officers.distance_behind - (travel * (officer_speed * random.uniform(0.8, 1.2))),
-                -50, 1000
+            officers.distance_behind = max(
+                -50, min(1000, officers.distance_behind - (travel * (officer_speed * _JITTER_STEADY[_randbyte(8)])))
             )
             print(f"You travel {travel} km at a steady pace.")
-            event_msg = random_event(player, camel, officers, difficulty)
+            event_msg = random_event(player, camel, officers, thresholds)
 
         elif choice == "C":
             # full speed
-            travel = random.randint(10, 20)
+            travel = int(_r() * 11) + 10
             player.distance += travel
-            player.thirst = clamp(player.thirst + random.randint(1, 2), 0, 5)
-            camel.stamina = clamp(camel.stamina + random.randint(10, 25), 0, 100)
-            officers.distance_behind = clamp(
-                officers.distance_behind - (travel * (officer_speed * random.uniform(0.4, 1.0))),
-                -50, 1000
+            player.thirst = min(5, player.thirst + int(_r() * 2) + 1)
+            camel.stamina = min(100, camel.stamina + int(_r() * 16) + 10)
+            officers.distance_behind = max(
+                -50, min(1000, officers.distance_behind - (travel * (officer_speed * _JITTER_DASH[_randbyte(8)])))
             )
             print(f"You dash full speed for {travel} km! The camel strains but you gain distance.")
-            if random.random() < 0.6:
-                event_msg = random_event(player, camel, officers, difficulty)
+            if _r() < 0.6:
+                event_msg = random_event(player, camel, officers, thresholds)
 
         elif choice == "D":
             # rest
-            recovered = random.randint(10, 30)
-            camel.stamina = clamp(camel.stamina - recovered, 0, 100)
-            player.thirst = clamp(player.thirst + 1, 0, 5)
-            officers.distance_behind = clamp(
-                officers.distance_behind + random.randint(7, 14) * (officer_speed * 10),
-                -50, 1000
+            recovered = int(_r() * 21) + 10
+            camel.stamina = max(0, camel.stamina - recovered)
+            player.thirst = min(5, player.thirst + 1)
+            officers.distance_behind = max(
+                -50, min(1000, officers.distance_behind + (int(_r() * 8) + 7) * (officer_speed * 10))
             )
             print(f"You rest for the day. The camel recovers {recovered} stamina (fatigue reduced).")
-            if random.random() < 0.12:
-                event_msg = random_event(player, camel, officers, difficulty)
+            if _r() < 0.12:
+                event_msg = random_event(player, camel, officers, thresholds)
 
         elif choice == "E":
-            if player.inventory.get("bandage", 0) > 0:
-                player.inventory["bandage"] -= 1
-                heal = random.randint(10, 30)
-                player.health = clamp(player.health + heal, 0, 100)
+            if player.bandage > 0:
+                player.bandage -= 1
+                heal = int(_r() * 21) + 10
+                player.health = min(100, player.health + heal)
                 print(f"You use a bandage and stabilize yourself (+{heal} health).")
             else:
                 print("No bandages available.")
@@ -332,8 +549,8 @@ def game_loop(player: Player, camel: Camel, officers: Officers, difficulty, offi
             print(f"Player Health: {player.health}/100")
             print(f"Thirst: {player.thirst}/5")
             print(f"Camel: Stamina {camel.stamina}% | Health {camel.health}/100")
-            print(f"Water: {player.inventory.get('water',0)} | Bandage: {player.inventory.get('bandage',0)}")
-            print(f"Achievements: {', '.join(sorted(player.achievements)) if player.achievements else '(none)'}")
+            print(f"Water: {player.water} | Bandage: {player.bandage}")
+            print(f"Achievements: {', '.join(sorted(_achievement_names(player.achievements))) or '(none)'}")
             input("\nPress Enter to continue...")
             continue
 
@@ -374,7 +591,7 @@ def game_loop(player: Player, camel: Camel, officers: Officers, difficulty, offi
         if player.distance >= TOTAL_DISTANCE:
             print("\n🏆 You crossed the Great Gobi and escaped to freedom!")
             player.score = calculate_score(player, camel, diff_multiplier)
-            player.achievements.add("Escape!")
+            player.achievements |= ACH_ESCAPE
             finalize(player, camel, diff_multiplier)
             return
 
@@ -384,16 +601,17 @@ def game_loop(player: Player, camel: Camel, officers: Officers, difficulty, offi
         pause_short()
 
 def finalize(player: Player, camel: Camel, diff_multiplier: float):
+    drain_saves()
     print_header("GAME OVER / SUMMARY")
     print(f"Distance traveled: {player.distance}/{TOTAL_DISTANCE} km")
     print(f"Final Player Health: {player.health}/100")
     print(f"Final Camel Stamina: {camel.stamina}% | Camel Health: {camel.health}/100")
-    print(f"Water left: {player.inventory.get('water',0)}")
+    print(f"Water left: {player.water}")
     print(f"Oases found: {player.oasis_found}")
     check_achievements(player, camel)
     print("\nAchievements unlocked:")
     if player.achievements:
-        for a in sorted(player.achievements):
+        for a in sorted(_achievement_names(player.achievements)):
             print(" - " + a)
     else:
         print(" (none)")